@@ -95,6 +95,10 @@ def track(  # type: ignore[return]
         True if event is sent successfully, False if not.
     """
     from zenml.analytics.context import AnalyticsContext
+    from zenml.analytics.utils import is_analytics_disabled
+
+    if is_analytics_disabled(event):
+        return False
 
     if metadata is None:
         metadata = {}
@@ -13,31 +13,88 @@
 #  permissions and limitations under the License.
 """The analytics client of ZenML."""
 
+import atexit
 import json
 import logging
-from typing import Any, Dict, Optional, Tuple
+import os
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from zenml.analytics.enums import AnalyticsEvent
 from zenml.analytics.request import post
 from zenml.analytics.utils import AnalyticsEncoder
 from zenml.constants import IS_DEBUG_ENV
+from zenml.enums import SourceContextTypes
 
 logger = logging.getLogger(__name__)
 
+# A queued message together with its source context. `None` is used as the
+# sentinel that stops the consumer thread.
+_Message = Tuple[str, SourceContextTypes]
+_QueueItem = Optional[_Message]
+
 
 class Client(object):
-    """The client class for ZenML analytics."""
+    """The client class for ZenML analytics.
+
+    Messages are not sent on the calling thread. They are put on a bounded
+    queue instead, which is drained by a background thread that posts them
+    to the analytics server in batches. For the default client, messages
+    that are still queued when the interpreter exits are flushed by an
+    `atexit` hook, and forked child processes start with an empty queue and
+    their own background thread.
+    """
 
-    def __init__(self, send: bool = True, timeout: int = 15) -> None:
+    def __init__(
+        self,
+        send: bool = True,
+        timeout: int = 15,
+        max_queue_size: int = 10000,
+        max_batch_size: int = 50,
+        upload_interval: float = 1,
+        flush_timeout: float = 5,
+    ) -> None:
         """Initialization of the client.
 
         Args:
             send: Flag to determine whether to send the message.
             timeout: Timeout in seconds.
+            max_queue_size: The maximum number of messages to keep in the
+                queue. If the queue is full, the oldest queued message is
+                dropped to make room for a new one.
+            max_batch_size: The maximum number of messages to send in a
+                single request.
+            upload_interval: The maximum time in seconds to wait for more
+                messages before sending an incomplete batch.
+            flush_timeout: The maximum time in seconds to wait for queued
+                messages to be sent when the interpreter exits.
         """
         self.send = send
         self.timeout = timeout
+        self.max_batch_size = max_batch_size
+        self.upload_interval = upload_interval
+        self.flush_timeout = flush_timeout
+        self.max_queue_size = max_queue_size
+
+        self._queue: "queue.Queue[_QueueItem]"
+        self._consumer: Optional[threading.Thread]
+        self._consumer_lock: threading.Lock
+        self._reset()
+
+    def _reset(self) -> None:
+        """Reset the queue and the background thread.
+
+        For the default client, this is also called in forked child
+        processes. These inherit the queued messages of the parent process
+        and possibly locks that were held by other threads while forking, but
+        not the background thread itself.
+        """
+        self._queue = queue.Queue(maxsize=self.max_queue_size)
+        self._consumer = None
+        self._consumer_lock = threading.Lock()
 
     def identify(
         self, user_id: UUID, traits: Optional[Dict[Any, Any]]
@@ -133,12 +190,109 @@ class Client(object):
         Returns:
             Tuple (success flag, the original message).
         """
+        from zenml.analytics import source_context
+
         # if send is False, return msg as if it was successfully queued
         if not self.send:
             return True, msg
 
-        post(timeout=self.timeout, batch=[msg])
+        self._ensure_consumer()
+
+        # The source context is a context variable which is not available
+        # in the consumer thread, so it is captured together with the message
+        item = (msg, source_context.get())
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            logger.debug("Analytics queue is full, dropping oldest message.")
+            try:
+                self._queue.get_nowait()
+                self._queue.put_nowait(item)
+            except (queue.Empty, queue.Full):
+                return False, msg
+
         return True, msg
 
+    def _ensure_consumer(self) -> None:
+        """Start the background thread that sends the queued messages."""
+        if self._consumer is not None and self._consumer.is_alive():
+            return
+
+        with self._consumer_lock:
+            if self._consumer is None or not self._consumer.is_alive():
+                self._consumer = threading.Thread(
+                    target=self._consume,
+                    name="zenml-analytics",
+                    daemon=True,
+                )
+                self._consumer.start()
+
+    def _consume(self) -> None:
+        """Send queued messages in batches until a stop sentinel is received."""
+        stop = False
+        while not stop:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            batch = [item]
+            deadline = time.monotonic() + self.upload_interval
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._upload(batch)
+
+    def _upload(self, messages: List[_Message]) -> None:
+        """Send a batch of messages.
+
+        The source context is sent as a request header, so messages with
+        different source contexts are sent in separate requests.
+
+        Args:
+            messages: The messages to send together with their source context.
+        """
+        batches: Dict[SourceContextTypes, List[str]] = {}
+        for msg, source in messages:
+            batches.setdefault(source, []).append(msg)
+
+        for source, batch in batches.items():
+            try:
+                post(timeout=self.timeout, batch=batch, source=source)
+            except Exception as e:
+                logger.debug(f"Sending analytics data failed: {e}")
+
+    def flush(self) -> None:
+        """Wait until all queued messages are sent.
+
+        This stops the background thread once the queue is drained. It is
+        restarted automatically when the next message is queued.
+        """
+        consumer = self._consumer
+        if consumer is None or not consumer.is_alive():
+            return
+
+        try:
+            self._queue.put(None, timeout=self.flush_timeout)
+        except queue.Full:
+            return
+
+        consumer.join(timeout=self.flush_timeout)
+
 
 default_client = Client()
+
+# These hooks can't be unregistered and keep their client alive until the
+# interpreter exits, so they are only registered for the default client
+atexit.register(default_client.flush)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=default_client._reset)
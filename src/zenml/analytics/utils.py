@@ -22,7 +22,11 @@ from uuid import UUID
 from zenml.analytics import identify, track
 from zenml.analytics.enums import AnalyticsEvent
 from zenml.analytics.models import AnalyticsTrackedModelMixin
-from zenml.constants import ENV_ZENML_ANALYTICS_OPT_IN
+from zenml.constants import (
+    ENV_ZENML_ANALYTICS_OPT_IN,
+    ENV_ZENML_SERVER,
+    handle_bool_env_var,
+)
 from zenml.logger import get_logger
 
 logger = get_logger(__name__)
@@ -77,6 +81,36 @@ class AnalyticsAPIError(Exception):
         return msg.format(self.message, self.status)
 
 
+def is_analytics_disabled(event: AnalyticsEvent) -> bool:
+    """Cheap check whether an event is known not to be tracked.
+
+    This is used to skip building the metadata of events that are not going
+    to be sent anyway. Inside a ZenML server, the analytics setting is stored
+    in the database, so the final decision is left to the analytics context.
+
+    Args:
+        event: The event to check.
+
+    Returns:
+        True if the event will not be tracked, False if it might be.
+    """
+    if event in {
+        AnalyticsEvent.OPT_IN_ANALYTICS,
+        AnalyticsEvent.OPT_OUT_ANALYTICS,
+    }:
+        return False
+
+    if handle_bool_env_var(ENV_ZENML_SERVER):
+        return False
+
+    from zenml.config.global_config import GlobalConfiguration
+
+    try:
+        return not GlobalConfiguration().analytics_opt_in
+    except Exception:
+        return False
+
+
 def email_opt_int(opted_in: bool, email: Optional[str], source: str) -> None:
     """Track the event of the users response to the email prompt, identify them.
 
@@ -166,6 +200,9 @@ def track_decorator(event: AnalyticsEvent) -> Callable[[F], F]:
             Returns:
                 Result of the function.
             """
+            if is_analytics_disabled(event):
+                return func(*args, **kwargs)
+
             with track_handler(event=event) as handler:
                 try:
                     for obj in list(args) + list(kwargs.values()):
@@ -19,6 +19,7 @@ artifacts get stored.
 """
 
 import os
+from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar, Optional, Set, Type, Union
 
 from pydantic import field_validator
@@ -31,7 +32,6 @@ from zenml.artifact_stores import (
 from zenml.config.global_config import GlobalConfiguration
 from zenml.exceptions import ArtifactStoreInterfaceError
 from zenml.io.local_filesystem import LocalFilesystem
-from zenml.utils import io_utils
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -122,7 +122,7 @@ class LocalArtifactStore(LocalFilesystem, BaseArtifactStore):
             self._path = self.config.path
         else:
             self._path = self.get_default_local_path(self.id)
-        io_utils.create_dir_recursive_if_not_exists(self._path)
+        Path(self._path).mkdir(parents=True, exist_ok=True)
         return self._path
 
     @property
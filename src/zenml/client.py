@@ -51,6 +51,7 @@ from zenml.constants import (
     ENV_ZENML_ENABLE_REPO_INIT_WARNINGS,
     ENV_ZENML_REPOSITORY_PATH,
     ENV_ZENML_SERVER,
+    FLAVOR_CACHE_TTL_SECONDS,
     PAGE_SIZE_DEFAULT,
     PAGINATION_STARTING_PAGE,
     REPOSITORY_DIRECTORY_NAME,
@@ -194,9 +195,10 @@ from zenml.services.service import ServiceConfig
 from zenml.services.service_status import ServiceState
 from zenml.services.service_type import ServiceType
 from zenml.utils import io_utils, source_utils
+from zenml.utils.cache_utils import TTLCache
 from zenml.utils.dict_utils import dict_to_bytes
 from zenml.utils.filesync_model import FileSyncModel
-from zenml.utils.pagination_utils import depaginate
+from zenml.utils.pagination_utils import depaginate, iterate_pages
 from zenml.utils.uuid_utils import is_valid_uuid
 
 if TYPE_CHECKING:
@@ -378,6 +380,9 @@ class Client(metaclass=ClientMetaClass):
         """
         self._root: Optional[Path] = None
         self._config: Optional[ClientConfiguration] = None
+        self._flavor_cache: TTLCache[
+            Tuple[str, UUID, str, StackComponentType], FlavorResponse
+        ] = TTLCache(ttl=FLAVOR_CACHE_TTL_SECONDS)
 
         self._set_active_root(root)
 
@@ -2194,6 +2199,7 @@ class Client(metaclass=ClientMetaClass):
             workspace=self.active_workspace.id,
         )
 
+        self._flavor_cache.clear()
         return self.zen_store.create_flavor(flavor=create_flavor_request)
 
     def get_flavor(
@@ -2286,6 +2292,7 @@ class Client(metaclass=ClientMetaClass):
             name_id_or_prefix, allow_name_prefix_match=False
         )
         self.zen_store.delete_flavor(flavor_id=flavor.id)
+        self._flavor_cache.clear()
 
         logger.info(f"Deleted flavor '{flavor.name}' of type '{flavor.type}'.")
 
@@ -2311,6 +2318,9 @@ class Client(metaclass=ClientMetaClass):
     ) -> FlavorResponse:
         """Fetches a registered flavor.
 
+        Flavors are resolved for every component each time a stack is loaded
+        and rarely change, so successful lookups are cached for a short time.
+
         Args:
             component_type: The type of the component to fetch.
             name: The name of the flavor to fetch.
@@ -2321,6 +2331,15 @@ class Client(metaclass=ClientMetaClass):
         Raises:
             KeyError: If no flavor exists for the given type and name.
         """
+        cache_key = (
+            self.zen_store.url,
+            self.active_workspace.id,
+            name,
+            component_type,
+        )
+        if cached_flavor := self._flavor_cache.get(cache_key):
+            return cached_flavor
+
         logger.debug(
             f"Fetching the flavor of type {component_type} with name {name}."
         )
@@ -2340,6 +2359,7 @@ class Client(metaclass=ClientMetaClass):
                 f"{component_type} exists."
             )
 
+        self._flavor_cache.set(cache_key, flavors[0])
         return flavors[0]
 
     # ------------------------------- Pipelines --------------------------------
@@ -4292,7 +4312,7 @@ class Client(metaclass=ClientMetaClass):
         Raises:
             ValueError: If the artifact version is still used in any runs.
         """
-        if artifact_version not in depaginate(
+        if artifact_version not in iterate_pages(
             self.list_artifact_versions, only_unused=True
         ):
             raise ValueError(
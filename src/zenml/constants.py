@@ -427,6 +427,13 @@ PAGE_SIZE_MAXIMUM: int = handle_int_env_var(
 FILTERING_DATETIME_FORMAT: str = "%Y-%m-%d %H:%M:%S"
 SORT_PIPELINES_BY_LATEST_RUN_KEY = "latest_run"
 
+# Caching constants
+DEPLOYMENT_CACHE_TTL_SECONDS = 60
+FLAVOR_CACHE_TTL_SECONDS = 60
+RUN_DAG_CACHE_TTL_SECONDS = 300
+USER_CACHE_TTL_SECONDS = 30
+WORKSPACE_CACHE_TTL_SECONDS = 60
+
 # Metadata constants
 METADATA_ORCHESTRATOR_URL = "orchestrator_url"
 METADATA_EXPERIMENT_TRACKER_URL = "experiment_tracker_url"
@@ -0,0 +1,149 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utilities for in-memory caching."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Thread-safe in-memory cache with a time-to-live for its entries.
+
+    Entries expire `ttl` seconds after they were set. If the cache is full,
+    the least recently used entry is evicted to make room for a new one.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: The time-to-live of the cache entries in seconds.
+            maxsize: The maximum number of entries to keep in the cache.
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_locks: Dict[K, threading.Lock] = {}
+        # Incremented whenever entries are removed, so that values which
+        # were loaded before the removal don't get stored afterwards
+        self._generation = 0
+
+    def get(self, key: K) -> Optional[V]:
+        """Get a value from the cache.
+
+        Args:
+            key: The key of the value.
+
+        Returns:
+            The cached value or None if the key is not cached or the entry
+            expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store a value in the cache.
+
+        Args:
+            key: The key of the value.
+            value: The value to store.
+        """
+        with self._lock:
+            self._set(key, value)
+
+    def _set(self, key: K, value: V) -> None:
+        """Store a value in the cache while holding the lock.
+
+        Args:
+            key: The key of the value.
+            value: The value to store.
+        """
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def get_or_load(self, key: K, loader: Callable[[], V]) -> V:
+        """Get a value from the cache or load and store it if it is missing.
+
+        Concurrent calls for the same missing key call the loader only once.
+        The other callers wait for the value to be loaded instead of loading
+        it themselves. If the loader raises an exception, nothing is cached
+        and the exception is propagated. If an entry is removed while the
+        value is being loaded, the loaded value is returned but not cached
+        as it might already be outdated.
+
+        Args:
+            key: The key of the value.
+            loader: Function that loads the value if it is not cached.
+
+        Returns:
+            The cached or loaded value.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        try:
+            with load_lock:
+                # Another caller might have loaded the value while we were
+                # waiting for the lock
+                value = self.get(key)
+                if value is None:
+                    with self._lock:
+                        generation = self._generation
+                    value = loader()
+                    with self._lock:
+                        if generation == self._generation:
+                            self._set(key, value)
+                return value
+        finally:
+            with self._lock:
+                if self._load_locks.get(key) is load_lock:
+                    del self._load_locks[key]
+
+    def pop(self, key: K) -> None:
+        """Remove a value from the cache.
+
+        Args:
+            key: The key of the value to remove.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self._generation += 1
+
+    def clear(self) -> None:
+        """Remove all values from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
@@ -25,7 +25,7 @@ from zenml.code_repositories import (
 )
 from zenml.logger import get_logger
 from zenml.utils import source_utils
-from zenml.utils.pagination_utils import depaginate
+from zenml.utils.pagination_utils import iterate_pages
 
 logger = get_logger(__name__)
 
@@ -106,7 +106,7 @@ def find_active_code_repository(
         return _CODE_REPOSITORY_CACHE[path]
 
     local_context: Optional["LocalRepositoryContext"] = None
-    for model in depaginate(list_method=Client().list_code_repositories):
+    for model in iterate_pages(list_method=Client().list_code_repositories):
         try:
             repo = BaseCodeRepository.from_model(model)
         except Exception:
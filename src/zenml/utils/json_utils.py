@@ -18,6 +18,8 @@ https://github.com/pydantic/pydantic/blob/v1.10.15/pydantic/json.py
 """
 
 import datetime
+import json
+import math
 from collections import deque
 from decimal import Decimal
 from enum import Enum
@@ -38,6 +40,11 @@ from uuid import UUID
 from pydantic import NameEmail, SecretBytes, SecretStr
 from pydantic.color import Color
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 __all__ = "pydantic_encoder"
 
 
@@ -129,3 +136,73 @@ def pydantic_encoder(obj: Any) -> Any:
             f"Object of type '{obj.__class__.__name__}' is not JSON "
             f"serializable."
         )
+
+
+def _contains_non_finite_float(obj: Any) -> bool:
+    """Check whether an object contains NaN or infinite float values.
+
+    Args:
+        obj: The JSON serializable object.
+
+    Returns:
+        Whether the object or any of its nested values is a non-finite float.
+    """
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_contains_non_finite_float(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_contains_non_finite_float(v) for v in obj)
+    return False
+
+
+def dumps_bytes(obj: Any, sort_keys: bool = False) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON bytes.
+
+    Uses `orjson` if it is installed, which is considerably faster than the
+    standard library and directly returns bytes. Objects that `orjson` can't
+    serialize fall back to the standard library `json` module. This includes
+    objects with non-finite floats, which `orjson` would write as `null`
+    while the standard library writes `NaN` and `Infinity`.
+
+    Args:
+        obj: The JSON serializable object.
+        sort_keys: Whether to sort the keys of dictionaries in the output.
+
+    Returns:
+        The JSON representation of the object.
+    """
+    if orjson is not None and not _contains_non_finite_float(obj):
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            pass
+
+    return json.dumps(obj, sort_keys=sort_keys).encode("utf-8")
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON document.
+
+    Uses `orjson` if it is installed, which is considerably faster than the
+    standard library. Documents that `orjson` rejects but the standard
+    library accepts, e.g. containing `NaN` values, fall back to the standard
+    library `json` module. Note that `orjson` parses integers that exceed
+    64 bits as floats.
+
+    Args:
+        data: The JSON document.
+
+    Returns:
+        The deserialized object.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            pass
+
+    return json.loads(data)
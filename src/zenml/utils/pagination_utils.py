@@ -13,13 +13,37 @@
 #  permissions and limitations under the License.
 """Pagination utilities."""
 
-from typing import Any, Callable, List, TypeVar
+from typing import Any, Callable, Iterator, List, TypeVar
 
 from zenml.models import BaseIdentifiedResponse, Page
 
 AnyResponse = TypeVar("AnyResponse", bound=BaseIdentifiedResponse)  # type: ignore[type-arg]
 
 
+def iterate_pages(
+    list_method: Callable[..., Page[AnyResponse]], **kwargs: Any
+) -> Iterator[AnyResponse]:
+    """Lazily iterate over the results of a method that returns pages.
+
+    Pages are only fetched when the items of the previous page were consumed,
+    so callers that stop iterating early don't fetch the remaining pages and
+    at most one page is kept in memory at a time.
+
+    Args:
+        list_method: The list method to iterate over.
+        **kwargs: Arguments for the list method.
+
+    Yields:
+        The corresponding Response Models.
+    """
+    page = list_method(**kwargs)
+    yield from page.items
+    while page.index < page.total_pages:
+        kwargs["page"] = page.index + 1
+        page = list_method(**kwargs)
+        yield from page.items
+
+
 def depaginate(
     list_method: Callable[..., Page[AnyResponse]], **kwargs: Any
 ) -> List[AnyResponse]:
@@ -32,11 +56,4 @@ def depaginate(
     Returns:
         A list of the corresponding Response Models.
     """
-    page = list_method(**kwargs)
-    items = list(page.items)
-    while page.index < page.total_pages:
-        kwargs["page"] = page.index + 1
-        page = list_method(**kwargs)
-        items += list(page.items)
-
-    return items
+    return list(iterate_pages(list_method, **kwargs))
@@ -13,7 +13,8 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for pipeline runs."""
 
-from typing import Any, Dict
+from datetime import datetime
+from typing import Any, Dict, Set, Tuple
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Security
@@ -22,6 +23,7 @@ from zenml.constants import (
     API,
     GRAPH,
     PIPELINE_CONFIGURATION,
+    RUN_DAG_CACHE_TTL_SECONDS,
     RUNS,
     STATUS,
     STEPS,
@@ -37,6 +39,7 @@ from zenml.models import (
     StepRunFilter,
     StepRunResponse,
 )
+from zenml.utils.cache_utils import TTLCache
 from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.rbac.endpoint_utils import (
@@ -45,10 +48,18 @@ from zenml.zen_server.rbac.endpoint_utils import (
     verify_permissions_and_list_entities,
     verify_permissions_and_update_entity,
 )
-from zenml.zen_server.rbac.models import ResourceType
+from zenml.zen_server.rbac.models import Action, Resource, ResourceType
+from zenml.zen_server.rbac.utils import (
+    dehydrate_response_model,
+    get_resource_for_model,
+    get_subresources_for_model,
+    verify_permission_for_model,
+)
 from zenml.zen_server.utils import (
     handle_exceptions,
     make_dependable,
+    rbac,
+    server_config,
     zen_store,
 )
 
@@ -58,6 +69,15 @@ router = APIRouter(
     responses={401: error_response, 403: error_response},
 )
 
+# The DAG of a run whose steps all finished doesn't change anymore, but the
+# dashboard requests it over and over again. Each graph is cached together
+# with the update time of its run and the resources it shows, which are
+# checked on every request.
+_CachedRunDag = Tuple[datetime, LineageGraph, Set[Resource]]
+_run_dag_cache: TTLCache[UUID, _CachedRunDag] = TTLCache(
+    ttl=RUN_DAG_CACHE_TTL_SECONDS, maxsize=256
+)
+
 
 @router.get(
     "",
@@ -163,6 +183,7 @@ def delete_run(
         get_method=zen_store().get_run,
         delete_method=zen_store().delete_run,
     )
+    _run_dag_cache.pop(run_id)
 
 
 @router.get(
@@ -173,24 +194,80 @@ def delete_run(
 @handle_exceptions
 def get_run_dag(
     run_id: UUID,
-    _: AuthContext = Security(authorize),
+    auth_context: AuthContext = Security(authorize),
 ) -> LineageGraph:
     """Get the DAG for a given pipeline run.
 
     Args:
         run_id: ID of the pipeline run to use to get the DAG.
+        auth_context: Authentication context.
 
     Returns:
         The DAG for a given pipeline run.
     """
-    run = verify_permissions_and_get_entity(
-        id=run_id, get_method=zen_store().get_run, hydrate=True
-    )
+    if cached := _run_dag_cache.get(run_id):
+        updated, graph, resources = cached
+        # The run might have been deleted through other endpoints or by
+        # other server workers, so the cached graph is only used if the run
+        # still exists unchanged and the user may still read all of it
+        run = zen_store().get_run(run_id, hydrate=False)
+        permissions = _get_read_permissions(
+            resources, auth_context=auth_context
+        )
+        if run.updated == updated and all(
+            permissions.get(resource, False) for resource in resources
+        ):
+            return graph
+
+    run = zen_store().get_run(run_id, hydrate=True)
+    verify_permission_for_model(run, action=Action.READ)
+
     graph = LineageGraph()
-    graph.generate_run_nodes_and_edges(run)
+    # A run is marked as failed as soon as one of its steps fails, while
+    # other steps might still be running. The graph of such runs still
+    # changes, so they're not cached.
+    if not (
+        run.status.is_finished
+        and all(step.status.is_finished for step in run.steps.values())
+    ):
+        graph.generate_run_nodes_and_edges(dehydrate_response_model(run))
+        return graph
+
+    resources = get_subresources_for_model(run)
+    if run_resource := get_resource_for_model(run):
+        resources.add(run_resource)
+    permissions = _get_read_permissions(resources, auth_context=auth_context)
+    graph.generate_run_nodes_and_edges(
+        dehydrate_response_model(run, permissions=permissions)
+    )
+
+    # Graphs are only shared if nothing was hidden from the user because of
+    # missing permissions
+    if all(permissions.get(resource, False) for resource in resources):
+        _run_dag_cache.set(run_id, (run.updated, graph, resources))
     return graph
 
 
+def _get_read_permissions(
+    resources: Set[Resource], auth_context: AuthContext
+) -> Dict[Resource, bool]:
+    """Get the read permissions of a user for the given resources.
+
+    Args:
+        resources: The resources to check.
+        auth_context: Authentication context of the user.
+
+    Returns:
+        Whether the user is allowed to read each of the resources.
+    """
+    if not server_config().rbac_enabled:
+        return {resource: True for resource in resources}
+
+    return rbac().check_permissions(
+        user=auth_context.user, resources=resources, action=Action.READ
+    )
+
+
 @router.get(
     "/{run_id}" + STEPS,
     response_model=Page[StepRunResponse],
@@ -15,6 +15,7 @@
 
 import os
 from abc import ABC
+from functools import lru_cache
 from typing import (
     Any,
     ClassVar,
@@ -56,9 +57,6 @@ from zenml.models import (
     WorkspaceResponse,
 )
 from zenml.utils.pydantic_utils import before_validator_handler
-from zenml.zen_stores.secrets_stores.sql_secrets_store import (
-    SqlSecretsStoreConfiguration,
-)
 from zenml.zen_stores.zen_store_interface import ZenStoreInterface
 
 logger = get_logger(__name__)
@@ -80,6 +78,8 @@ class BaseZenStore(
     TYPE: ClassVar[StoreType]
     CONFIG_TYPE: ClassVar[Type[StoreConfiguration]]
 
+    _default_workspace: Optional[WorkspaceResponse] = None
+
     @model_validator(mode="before")
     @classmethod
     @before_validator_handler
@@ -97,26 +97,28 @@ class BaseZenStore(
         Returns:
             The converted configuration object.
         """
+        config_class: Type[StoreConfiguration]
         if data["config"].type == StoreType.SQL:
             from zenml.zen_stores.sql_zen_store import SqlZenStoreConfiguration
 
-            data["config"] = SqlZenStoreConfiguration(
-                **data["config"].model_dump()
-            )
+            config_class = SqlZenStoreConfiguration
 
         elif data["config"].type == StoreType.REST:
             from zenml.zen_stores.rest_zen_store import (
                 RestZenStoreConfiguration,
             )
 
-            data["config"] = RestZenStoreConfiguration(
-                **data["config"].model_dump()
-            )
+            config_class = RestZenStoreConfiguration
         else:
             raise ValueError(
                 f"Unknown type '{data['config'].type}' for the configuration."
             )
 
+        # Configurations that already have the correct type have been
+        # validated before and don't need to be dumped and validated again
+        if not isinstance(data["config"], config_class):
+            data["config"] = config_class(**data["config"].model_dump())
+
         return data
 
     # ---------------------------------
@@ -183,9 +185,13 @@ class BaseZenStore(
             logger.debug("Skipping database initialization")
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_store_class(store_type: StoreType) -> Type["BaseZenStore"]:
         """Returns the class of the given store type.
 
+        The result is cached, so the store implementation module is only
+        looked up once per store type.
+
         Args:
             store_type: The type of the store to get the class for.
 
@@ -237,13 +243,17 @@ class BaseZenStore(
         Raises:
             TypeError: If no store type was found to support the supplied URL.
         """
+        # The REST store is checked first because the check is cheap and
+        # avoids importing the SQL store dependencies for client-only setups.
         from zenml.zen_stores.rest_zen_store import RestZenStoreConfiguration
+
+        if RestZenStoreConfiguration.supports_url_scheme(url):
+            return StoreType.REST
+
         from zenml.zen_stores.sql_zen_store import SqlZenStoreConfiguration
 
         if SqlZenStoreConfiguration.supports_url_scheme(url):
             return StoreType.SQL
-        elif RestZenStoreConfiguration.supports_url_scheme(url):
-            return StoreType.REST
         else:
             raise TypeError(f"No store implementation found for URL: {url}.")
 
@@ -287,6 +297,9 @@ class BaseZenStore(
         Returns:
             The default store configuration.
         """
+        from zenml.zen_stores.secrets_stores.sql_secrets_store import (
+            SqlSecretsStoreConfiguration,
+        )
         from zenml.zen_stores.sql_zen_store import SqlZenStoreConfiguration
 
         config = SqlZenStoreConfiguration(
@@ -463,16 +476,24 @@ class BaseZenStore(
     def _get_default_workspace(self) -> WorkspaceResponse:
         """Get the default workspace.
 
+        The default workspace can neither be renamed nor deleted, so it is
+        cached on the store instance after the first successful lookup.
+
         Raises:
             KeyError: If the default workspace doesn't exist.
 
         Returns:
             The default workspace.
         """
-        try:
-            return self.get_workspace(self._default_workspace_name)
-        except KeyError:
-            raise KeyError("Unable to find default workspace.")
+        if self._default_workspace is None:
+            try:
+                self._default_workspace = self.get_workspace(
+                    self._default_workspace_name
+                )
+            except KeyError:
+                raise KeyError("Unable to find default workspace.")
+
+        return self._default_workspace
 
     def _get_default_stack(
         self,
@@ -0,0 +1,31 @@
+"""Add pipeline run list index [c879e04055cd].
+
+Revision ID: c879e04055cd
+Revises: 0.63.0
+Create Date: 2024-08-05 10:12:31.204851
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c879e04055cd"
+down_revision = "0.63.0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    with op.batch_alter_table("pipeline_run", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_pipeline_run_workspace_id_pipeline_id_created",
+            ["workspace_id", "pipeline_id", "created"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    with op.batch_alter_table("pipeline_run", schema=None) as batch_op:
+        batch_op.drop_index("ix_pipeline_run_workspace_id_pipeline_id_created")
@@ -3433,6 +3433,7 @@ class RestZenStore(BaseZenStore):
         Returns:
             The updated workspace.
         """
+        self._default_workspace = None
         return self._update_resource(
             resource_id=workspace_id,
             resource_update=workspace_update,
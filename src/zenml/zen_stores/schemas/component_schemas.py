@@ -28,6 +28,7 @@ from zenml.models import (
     ComponentResponseMetadata,
     ComponentUpdate,
 )
+from zenml.utils.json_utils import dumps_bytes
 from zenml.zen_stores.schemas.base_schemas import NamedSchema
 from zenml.zen_stores.schemas.schema_utils import build_foreign_key_field
 from zenml.zen_stores.schemas.service_connector_schemas import (
@@ -129,11 +130,11 @@ class StackComponentSchema(NamedSchema, table=True):
         ).items():
             if field == "configuration":
                 self.configuration = base64.b64encode(
-                    json.dumps(component_update.configuration).encode("utf-8")
+                    dumps_bytes(component_update.configuration)
                 )
             elif field == "labels":
                 self.labels = base64.b64encode(
-                    json.dumps(component_update.labels).encode("utf-8")
+                    dumps_bytes(component_update.labels)
                 )
             elif field == "type":
                 component_type = component_update.type
@@ -180,10 +181,8 @@ class StackComponentSchema(NamedSchema, table=True):
         if include_metadata:
             metadata = ComponentResponseMetadata(
                 workspace=self.workspace.to_model(),
-                configuration=json.loads(
-                    base64.b64decode(self.configuration).decode()
-                ),
-                labels=json.loads(base64.b64decode(self.labels).decode())
+                configuration=json.loads(base64.b64decode(self.configuration)),
+                labels=json.loads(base64.b64decode(self.labels))
                 if self.labels
                 else None,
                 component_spec_path=self.component_spec_path,
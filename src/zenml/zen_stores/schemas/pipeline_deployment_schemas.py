@@ -13,8 +13,9 @@
 #  permissions and limitations under the License.
 """SQLModel implementation of pipeline deployment tables."""
 
+import copy
 import json
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from sqlalchemy import TEXT, Column, String
@@ -31,6 +32,7 @@ from zenml.models import (
     PipelineDeploymentResponseBody,
     PipelineDeploymentResponseMetadata,
 )
+from zenml.utils import json_utils
 from zenml.utils.json_utils import pydantic_encoder
 from zenml.zen_stores.schemas.base_schemas import BaseSchema
 from zenml.zen_stores.schemas.code_repository_schemas import (
@@ -209,10 +211,25 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
             else None,
         )
 
+    def load_configurations(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Load the pipeline and step configurations of the deployment.
+
+        Returns:
+            The deserialized JSON of the pipeline configuration and the step
+            configurations.
+        """
+        # The step configurations contain user-provided parameters, which
+        # might include integers that `orjson` can't represent
+        return (
+            json.loads(self.pipeline_configuration),
+            json.loads(self.step_configurations),
+        )
+
     def to_model(
         self,
         include_metadata: bool = False,
         include_resources: bool = False,
+        configurations: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None,
         **kwargs: Any,
     ) -> PipelineDeploymentResponse:
         """Convert a `PipelineDeploymentSchema` to a `PipelineDeploymentResponse`.
@@ -220,19 +237,16 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
         Args:
             include_metadata: Whether the metadata will be filled.
             include_resources: Whether the resources will be filled.
+            configurations: The pipeline and step configurations as returned
+                by `load_configurations`. If not given, they will be loaded
+                from the schema if needed. These are copied before they are
+                validated, so they can be shared between calls.
             **kwargs: Keyword arguments to allow schema specific logic
 
 
         Returns:
             The created `PipelineDeploymentResponse`.
         """
-        pipeline_configuration = PipelineConfiguration.model_validate_json(
-            self.pipeline_configuration
-        )
-        step_configurations = json.loads(self.step_configurations)
-        for s, c in step_configurations.items():
-            step_configurations[s] = Step.model_validate(c)
-
         body = PipelineDeploymentResponseBody(
             user=self.user.to_model() if self.user else None,
             created=self.created,
@@ -240,12 +254,32 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
         )
         metadata = None
         if include_metadata:
+            # The configurations are only part of the metadata. They are
+            # large for pipelines with many steps, so we only parse them when
+            # they're actually needed.
+            if configurations is None:
+                configurations = self.load_configurations()
+            else:
+                # The before-validators of the configuration models modify
+                # their input in place
+                configurations = copy.deepcopy(configurations)
+            pipeline_configuration_json, step_configurations_json = (
+                configurations
+            )
+            pipeline_configuration = PipelineConfiguration.model_validate(
+                pipeline_configuration_json
+            )
+            step_configurations = {
+                name: Step.model_validate(step_configuration)
+                for name, step_configuration in step_configurations_json.items()
+            }
+
             metadata = PipelineDeploymentResponseMetadata(
                 workspace=self.workspace.to_model(),
                 run_name_template=self.run_name_template,
                 pipeline_configuration=pipeline_configuration,
                 step_configurations=step_configurations,
-                client_environment=json.loads(self.client_environment),
+                client_environment=json_utils.loads(self.client_environment),
                 client_version=self.client_version,
                 server_version=self.server_version,
                 pipeline=self.pipeline.to_model() if self.pipeline else None,
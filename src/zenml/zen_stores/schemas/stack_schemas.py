@@ -27,6 +27,7 @@ from zenml.models import (
     StackResponseMetadata,
     StackUpdate,
 )
+from zenml.utils.json_utils import dumps_bytes
 from zenml.zen_stores.schemas.base_schemas import NamedSchema
 from zenml.zen_stores.schemas.schema_utils import build_foreign_key_field
 from zenml.zen_stores.schemas.user_schemas import UserSchema
@@ -129,7 +130,7 @@ class StackSchema(NamedSchema, table=True):
                 self.components = components
             elif field == "labels":
                 self.labels = base64.b64encode(
-                    json.dumps(stack_update.labels).encode("utf-8")
+                    dumps_bytes(stack_update.labels)
                 )
             else:
                 setattr(self, field, value)
@@ -165,7 +166,7 @@ class StackSchema(NamedSchema, table=True):
                 workspace=self.workspace.to_model(),
                 components={c.type: [c.to_model()] for c in self.components},
                 stack_spec_path=self.stack_spec_path,
-                labels=json.loads(base64.b64decode(self.labels).decode())
+                labels=json.loads(base64.b64decode(self.labels))
                 if self.labels
                 else None,
             )
@@ -13,9 +13,11 @@
 #  permissions and limitations under the License.
 """SQLModel implementation of step run tables."""
 
+import copy
 import json
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, List, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from uuid import UUID
 
 from sqlalchemy import TEXT, Column, String
@@ -51,6 +53,27 @@ if TYPE_CHECKING:
     from zenml.zen_stores.schemas.run_metadata_schemas import RunMetadataSchema
 
 
+@lru_cache(maxsize=16)
+def _load_step_configurations(step_configurations: str) -> Dict[str, Any]:
+    """Load the step configurations of a deployment.
+
+    All steps of a run share the step configurations of their deployment, so
+    converting the steps of a run would otherwise parse the same JSON once per
+    step. The returned dictionary is shared between callers and must not be
+    modified, so its entries need to be copied before they are validated.
+    The standard library is used for parsing as the configurations
+    contain user-provided parameters, which might include integers that
+    `orjson` can't represent.
+
+    Args:
+        step_configurations: The JSON-serialized step configurations.
+
+    Returns:
+        The step configurations.
+    """
+    return json.loads(step_configurations)  # type: ignore[no-any-return]
+
+
 class StepRunSchema(NamedSchema, table=True):
     """SQL Model for steps of pipeline runs."""
 
@@ -215,12 +238,14 @@ class StepRunSchema(NamedSchema, table=True):
 
         full_step_config = None
         if self.deployment is not None:
-            step_configuration = json.loads(
+            step_configuration = _load_step_configurations(
                 self.deployment.step_configurations
             )
             if self.name in step_configuration:
+                # The validators of the step remove deprecated attributes
+                # from their input, which must not change the cached value
                 full_step_config = Step.model_validate(
-                    step_configuration[self.name]
+                    copy.deepcopy(step_configuration[self.name])
                 )
             elif not self.step_configuration:
                 raise ValueError(
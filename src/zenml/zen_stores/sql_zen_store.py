@@ -52,14 +52,14 @@ from pydantic import (
     field_validator,
     model_validator,
 )
-from sqlalchemy import asc, case, desc, func
+from sqlalchemy import asc, case, desc, event, exists, func
 from sqlalchemy.engine import URL, Engine, make_url
 from sqlalchemy.exc import (
     ArgumentError,
     IntegrityError,
     NoResultFound,
 )
-from sqlalchemy.orm import Mapped, noload
+from sqlalchemy.orm import Mapped, defer, noload, selectinload
 from sqlalchemy.util import immutabledict
 from sqlmodel import (
     Session,
@@ -68,7 +68,6 @@ from sqlmodel import (
     col,
     create_engine,
     delete,
-    or_,
     select,
 )
 from sqlmodel.sql.expression import Select, SelectOfScalar
@@ -77,7 +76,6 @@ from zenml.analytics import track
 from zenml.analytics.context import AnalyticsContext
 from zenml.analytics.enums import AnalyticsEvent
 from zenml.analytics.utils import (
-    analytics_disabler,
     track_decorator,
     track_handler,
 )
@@ -90,6 +88,7 @@ from zenml.constants import (
     DEFAULT_PASSWORD,
     DEFAULT_STACK_AND_COMPONENT_NAME,
     DEFAULT_USERNAME,
+    DEPLOYMENT_CACHE_TTL_SECONDS,
     ENV_ZENML_DEFAULT_USER_NAME,
     ENV_ZENML_DEFAULT_USER_PASSWORD,
     ENV_ZENML_DISABLE_DATABASE_MIGRATION,
@@ -99,6 +98,8 @@ from zenml.constants import (
     SORT_PIPELINES_BY_LATEST_RUN_KEY,
     SQL_STORE_BACKUP_DIRECTORY_NAME,
     TEXT_FIELD_MAX_LENGTH,
+    USER_CACHE_TTL_SECONDS,
+    WORKSPACE_CACHE_TTL_SECONDS,
     handle_bool_env_var,
     is_false_string_value,
     is_true_string_value,
@@ -290,7 +291,9 @@ from zenml.service_connectors.service_connector_registry import (
 from zenml.stack.flavor_registry import FlavorRegistry
 from zenml.stack_deployments.utils import get_stack_deployment_class
 from zenml.utils import uuid_utils
+from zenml.utils.cache_utils import TTLCache
 from zenml.utils.enum_utils import StrEnum
+from zenml.utils.json_utils import dumps_bytes, loads
 from zenml.utils.networking_utils import (
     replace_localhost_with_internal_hostname,
 )
@@ -372,6 +375,79 @@ logger = get_logger(__name__)
 
 ZENML_SQLITE_DB_FILENAME = "zenml.db"
 
+# Base64 encoded JSON representations of empty configurations and labels.
+# These are precomputed because they are stored for every default stack and
+# stack component and don't need to be serialized over and over again.
+_EMPTY_CONFIG_B64 = base64.b64encode(b"{}")
+_NULL_LABELS_B64 = base64.b64encode(b"null")
+
+
+def _encode_json_b64(value: Any) -> bytes:
+    """Serialize a value to base64 encoded JSON.
+
+    Args:
+        value: The JSON serializable value to encode.
+
+    Returns:
+        The base64 encoded JSON representation of the value.
+    """
+    if value is None:
+        return _NULL_LABELS_B64
+    if value == {}:
+        return _EMPTY_CONFIG_B64
+    return base64.b64encode(dumps_bytes(value))
+
+
+def _set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """Configure a new SQLite connection for faster queries.
+
+    Only connection level pragmas are set here. The journal mode and
+    synchronous settings are left at their defaults, because a WAL journal
+    is persisted in the database file and would not be covered by the file
+    copy used to backup and restore SQLite databases.
+
+    Args:
+        dbapi_connection: The DBAPI connection that was created.
+        connection_record: The connection pool record of the connection.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-20000")
+    finally:
+        cursor.close()
+
+
+def _artifact_version_load_options() -> List[Any]:
+    """Get the loader options for converting artifact versions in bulk.
+
+    The body of every artifact version response includes its artifact, user,
+    tags and producer step run, and the artifact body includes its own tags
+    and versions. Loading these eagerly resolves them for all artifact
+    versions of a query with one `IN (...)` query per relationship instead of
+    separate queries for each artifact version.
+
+    Returns:
+        The loader options, relative to an `ArtifactVersionSchema`.
+    """
+    return [
+        selectinload(ArtifactVersionSchema.artifact).options(  # type: ignore[arg-type]
+            selectinload(ArtifactSchema.versions),  # type: ignore[arg-type]
+            selectinload(ArtifactSchema.tags)  # type: ignore[arg-type]
+            .selectinload(TagResourceSchema.tag)  # type: ignore[arg-type]
+            .selectinload(TagSchema.links),  # type: ignore[arg-type]
+        ),
+        selectinload(ArtifactVersionSchema.user),  # type: ignore[arg-type]
+        selectinload(ArtifactVersionSchema.tags)  # type: ignore[arg-type]
+        .selectinload(TagResourceSchema.tag)  # type: ignore[arg-type]
+        .selectinload(TagSchema.links),  # type: ignore[arg-type]
+        selectinload(
+            ArtifactVersionSchema.output_of_step_runs  # type: ignore[arg-type]
+        ).selectinload(
+            StepRunOutputArtifactSchema.step_run  # type: ignore[arg-type]
+        ),
+    ]
+
 
 class SQLDatabaseDriver(StrEnum):
     """SQL database drivers supported by the SQL ZenML store."""
@@ -412,6 +488,14 @@ class SqlZenStoreConfiguration(StoreConfiguration):
         pool_pre_ping: Enable emitting a test statement on the SQL connection
             at the start of each connection pool checkout, to test that the
             database connection is still viable.
+        pool_recycle: The number of seconds after which pooled connections
+            are replaced with new ones. Set to -1 to never recycle
+            connections.
+        pool_use_lifo: Reuse the most recently returned connection from the
+            pool first. When combined with `pool_pre_ping`, this allows
+            connections that become idle to be closed by the server.
+        query_cache_size: The number of compiled SQL statements that the
+            SQLAlchemy engine caches.
     """
 
     type: StoreType = StoreType.SQL
@@ -432,6 +516,9 @@ class SqlZenStoreConfiguration(StoreConfiguration):
     pool_size: int = 20
     max_overflow: int = 20
     pool_pre_ping: bool = True
+    pool_recycle: int = 3600
+    pool_use_lifo: bool = False
+    query_cache_size: int = 1200
 
     backup_strategy: DatabaseBackupStrategy = DatabaseBackupStrategy.IN_MEMORY
     # database backup directory
@@ -717,7 +804,7 @@ class SqlZenStoreConfiguration(StoreConfiguration):
         """
         sql_url = make_url(self.url)
         sqlalchemy_connect_args: Dict[str, Any] = {}
-        engine_args = {}
+        engine_args: Dict[str, Any] = {}
         if sql_url.drivername == SQLDatabaseDriver.SQLITE:
             assert self.database is not None
             # The following default value is needed for sqlite to avoid the
@@ -739,6 +826,8 @@ class SqlZenStoreConfiguration(StoreConfiguration):
                 "pool_size": self.pool_size,
                 "max_overflow": self.max_overflow,
                 "pool_pre_ping": self.pool_pre_ping,
+                "pool_recycle": self.pool_recycle,
+                "pool_use_lifo": self.pool_use_lifo,
             }
 
             sql_url = sql_url._replace(
@@ -770,6 +859,8 @@ class SqlZenStoreConfiguration(StoreConfiguration):
                 f"SQL driver `{sql_url.drivername}` is not supported."
             )
 
+        engine_args["query_cache_size"] = self.query_cache_size
+
         return sql_url, sqlalchemy_connect_args, engine_args
 
     model_config = ConfigDict(
@@ -805,6 +896,15 @@ class SqlZenStore(BaseZenStore):
     _backup_secrets_store: Optional[BaseSecretsStore] = None
     _should_send_user_enriched_events: bool = False
     _cached_onboarding_state: Optional[Set[str]] = None
+    _user_cache: Optional[
+        TTLCache[Tuple[Union[str, UUID], bool], UserResponse]
+    ] = None
+    _workspace_cache: Optional[
+        TTLCache[Tuple[Union[str, UUID], bool], WorkspaceResponse]
+    ] = None
+    _deployment_configurations_cache: Optional[
+        TTLCache[UUID, Tuple[Dict[str, Any], Dict[str, Any]]]
+    ] = None
 
     @property
     def secrets_store(self) -> "BaseSecretsStore":
@@ -1065,10 +1165,18 @@ class SqlZenStore(BaseZenStore):
         """Initialize the SQL store."""
         logger.debug("Initializing SqlZenStore at %s", self.config.url)
 
+        self._user_cache = TTLCache(ttl=USER_CACHE_TTL_SECONDS)
+        self._workspace_cache = TTLCache(ttl=WORKSPACE_CACHE_TTL_SECONDS)
+        self._deployment_configurations_cache = TTLCache(
+            ttl=DEPLOYMENT_CACHE_TTL_SECONDS, maxsize=128
+        )
+
         url, connect_args, engine_args = self.config.get_sqlalchemy_config()
         self._engine = create_engine(
             url=url, connect_args=connect_args, **engine_args
         )
+        if self.config.driver == SQLDatabaseDriver.SQLITE:
+            event.listen(self._engine, "connect", _set_sqlite_pragmas)
         self._migration_utils = MigrationUtils(
             url=url,
             connect_args=connect_args,
@@ -1143,15 +1251,41 @@ class SqlZenStore(BaseZenStore):
 
     def _initialize_database(self) -> None:
         """Initialize the database if not already initialized."""
-        # Make sure the default workspace exists
-        self._get_or_create_default_workspace()
-        # Make sure the server is activated and the default user exists, if
-        # applicable
-        self._auto_activate_server()
+        if not self._defaults_initialized():
+            # Make sure the default workspace exists
+            self._get_or_create_default_workspace()
+            # Make sure the server is activated and the default user exists,
+            # if applicable
+            self._auto_activate_server()
 
         # Send user enriched events that we missed due to a bug in 0.57.0
         self._send_user_enriched_events_if_necessary()
 
+    def _defaults_initialized(self) -> bool:
+        """Check whether the database defaults have already been initialized.
+
+        Checks both the default workspace and the server activation with a
+        single query, which is the common case for an existing database.
+        These cover all defaults created by `_initialize_database`, as the
+        default user is only created when the server is activated.
+
+        Returns:
+            True if the default workspace exists and the server is active,
+            False otherwise.
+        """
+        default_workspace_exists = exists().where(
+            col(WorkspaceSchema.name) == self._default_workspace_name
+        )
+        server_active = exists().where(
+            col(ServerSettingsSchema.active).is_(True)
+        )
+        with Session(self.engine) as session:
+            return bool(
+                session.exec(
+                    select(and_(default_workspace_exists, server_active))
+                ).one()
+            )
+
     def _get_db_backup_file_path(self) -> str:
         """Get the path to the database backup file.
 
@@ -2783,7 +2917,9 @@ class SqlZenStore(BaseZenStore):
             A list of all artifact versions matching the filter criteria.
         """
         with Session(self.engine) as session:
-            query = select(ArtifactVersionSchema)
+            query = select(ArtifactVersionSchema).options(
+                *_artifact_version_load_options()
+            )
             return self.filter_and_paginate(
                 session=session,
                 query=query,
@@ -3214,12 +3350,8 @@ class SqlZenStore(BaseZenStore):
                 component_spec_path=component.component_spec_path,
                 type=component.type,
                 flavor=component.flavor,
-                configuration=base64.b64encode(
-                    json.dumps(component.configuration).encode("utf-8")
-                ),
-                labels=base64.b64encode(
-                    json.dumps(component.labels).encode("utf-8")
-                ),
+                configuration=_encode_json_b64(component.configuration),
+                labels=_encode_json_b64(component.labels),
                 connector=service_connector,
                 connector_resource_id=component.connector_resource_id,
             )
@@ -4265,6 +4397,12 @@ class SqlZenStore(BaseZenStore):
         """
         with Session(self.engine) as session:
             query = select(PipelineBuildSchema)
+            if not hydrate:
+                # The images are only included in the build metadata and can
+                # be large, so we don't load them if they're not needed
+                query = query.options(
+                    defer(PipelineBuildSchema.images)  # type: ignore[arg-type]
+                )
             return self.filter_and_paginate(
                 session=session,
                 query=query,
@@ -4346,18 +4484,36 @@ class SqlZenStore(BaseZenStore):
         """
         with Session(self.engine) as session:
             # Check if deployment with the given ID exists
-            deployment = session.exec(
-                select(PipelineDeploymentSchema).where(
-                    PipelineDeploymentSchema.id == deployment_id
+            query = select(PipelineDeploymentSchema).where(
+                PipelineDeploymentSchema.id == deployment_id
+            )
+            if self._deployment_configurations_cache is not None:
+                # The configurations are loaded through the cache
+                query = query.options(
+                    defer(PipelineDeploymentSchema.pipeline_configuration),  # type: ignore[arg-type]
+                    defer(PipelineDeploymentSchema.step_configurations),  # type: ignore[arg-type]
                 )
-            ).first()
+            deployment = session.exec(query).first()
             if deployment is None:
                 raise KeyError(
                     f"Unable to get deployment with ID '{deployment_id}': "
                     "No deployment with this ID found."
                 )
 
-            return deployment.to_model(include_metadata=hydrate)
+            if not hydrate or self._deployment_configurations_cache is None:
+                return deployment.to_model(include_metadata=hydrate)
+
+            # The configurations of a deployment never change and are needed
+            # by every step of the pipeline run, so we cache them to avoid
+            # loading and parsing them over and over again. All other
+            # resources included in the response can change and are always
+            # loaded.
+            configurations = self._deployment_configurations_cache.get_or_load(
+                deployment_id, deployment.load_configurations
+            )
+            return deployment.to_model(
+                include_metadata=True, configurations=configurations
+            )
 
     def list_deployments(
         self,
@@ -4410,6 +4566,9 @@ class SqlZenStore(BaseZenStore):
             session.delete(deployment)
             session.commit()
 
+        if self._deployment_configurations_cache is not None:
+            self._deployment_configurations_cache.pop(deployment_id)
+
     # -------------------- Run templates --------------------
 
     @track_decorator(AnalyticsEvent.CREATED_RUN_TEMPLATE)
@@ -5106,7 +5265,17 @@ class SqlZenStore(BaseZenStore):
             A list of all pipeline runs matching the filter criteria.
         """
         with Session(self.engine) as session:
-            query = select(PipelineRunSchema)
+            # The deployment and run metadata are needed to convert every run
+            # in the page, so we load them for all runs at once instead of
+            # once per run
+            query = select(PipelineRunSchema).options(
+                selectinload(PipelineRunSchema.deployment),  # type: ignore[arg-type]
+                selectinload(PipelineRunSchema.run_metadata),  # type: ignore[arg-type]
+            )
+            if hydrate:
+                query = query.options(
+                    selectinload(PipelineRunSchema.step_runs)  # type: ignore[arg-type]
+                )
             return self.filter_and_paginate(
                 session=session,
                 query=query,
@@ -6332,6 +6501,7 @@ class SqlZenStore(BaseZenStore):
             )
             session.add(existing_service_account)
             session.commit()
+            self._invalidate_user_cache()
 
             # Refresh the Model that was just created
             session.refresh(existing_service_account)
@@ -6371,6 +6541,7 @@ class SqlZenStore(BaseZenStore):
 
             session.delete(service_account)
             session.commit()
+            self._invalidate_user_cache()
 
     # --------------------------- Service Connectors ---------------------------
 
@@ -7196,13 +7367,10 @@ class SqlZenStore(BaseZenStore):
                 if stack.components is not None
                 else []
             )
-            filters = [
-                (StackComponentSchema.id == component_id)
-                for component_id in component_ids
-            ]
-
             defined_components = session.exec(
-                select(StackComponentSchema).where(or_(*filters))
+                select(StackComponentSchema).where(
+                    col(StackComponentSchema.id).in_(component_ids)
+                )
             ).all()
 
             new_stack_schema = StackSchema(
@@ -7212,9 +7380,7 @@ class SqlZenStore(BaseZenStore):
                 name=stack.name,
                 description=stack.description,
                 components=defined_components,
-                labels=base64.b64encode(
-                    json.dumps(stack.labels).encode("utf-8")
-                ),
+                labels=_encode_json_b64(stack.labels),
             )
 
             session.add(new_stack_schema)
@@ -7535,6 +7701,13 @@ class SqlZenStore(BaseZenStore):
         """
         with Session(self.engine) as session:
             query = select(StackSchema)
+            if hydrate:
+                # Hydrated stacks include their components, so we load the
+                # components of all stacks in the page with a single query
+                # instead of one query per stack
+                query = query.options(
+                    selectinload(StackSchema.components)  # type: ignore[arg-type]
+                )
             return self.filter_and_paginate(
                 session=session,
                 query=query,
@@ -7587,14 +7760,16 @@ class SqlZenStore(BaseZenStore):
 
             components: List["StackComponentSchema"] = []
             if stack_update.components:
-                filters = [
-                    (StackComponentSchema.id == component_id)
+                component_ids = [
+                    component_id
                     for list_of_component_ids in stack_update.components.values()
                     for component_id in list_of_component_ids
                 ]
                 components = list(
                     session.exec(
-                        select(StackComponentSchema).where(or_(*filters))
+                        select(StackComponentSchema).where(
+                            col(StackComponentSchema.id).in_(component_ids)
+                        )
                     ).all()
                 )
 
@@ -7692,7 +7867,8 @@ class SqlZenStore(BaseZenStore):
         """Create the default stack components and stack.
 
         The default stack contains a local orchestrator and a local artifact
-        store.
+        store. The components and the stack are created in a single
+        transaction.
 
         Args:
             workspace_id: ID of the workspace to which the stack
@@ -7701,54 +7877,89 @@ class SqlZenStore(BaseZenStore):
         Returns:
             The model of the created default stack.
         """
-        with analytics_disabler():
-            workspace = self.get_workspace(workspace_name_or_id=workspace_id)
+        with Session(self.engine) as session:
+            workspace = self._get_workspace_schema(
+                workspace_name_or_id=workspace_id, session=session
+            )
 
             logger.info(
                 f"Creating default stack in workspace {workspace.name}..."
             )
 
-            orchestrator = self.create_stack_component(
-                component=InternalComponentRequest(
-                    # Passing `None` for the user here means the orchestrator
-                    # is owned by the server, which for RBAC indicates that
+            component_requests = [
+                InternalComponentRequest(
+                    # Passing `None` for the user here means the component is
+                    # owned by the server, which for RBAC indicates that
                     # everyone can read it
                     user=None,
                     workspace=workspace.id,
                     name=DEFAULT_STACK_AND_COMPONENT_NAME,
-                    type=StackComponentType.ORCHESTRATOR,
+                    type=component_type,
                     flavor="local",
                     configuration={},
-                ),
-            )
-
-            artifact_store = self.create_stack_component(
-                component=InternalComponentRequest(
-                    # Passing `None` for the user here means the stack is owned
-                    # by the server, which for RBAC indicates that everyone can
-                    # read it
-                    user=None,
-                    workspace=workspace.id,
-                    name=DEFAULT_STACK_AND_COMPONENT_NAME,
-                    type=StackComponentType.ARTIFACT_STORE,
-                    flavor="local",
-                    configuration={},
-                ),
-            )
+                )
+                for component_type in (
+                    StackComponentType.ORCHESTRATOR,
+                    StackComponentType.ARTIFACT_STORE,
+                )
+            ]
 
-            components = {
-                c.type: [c.id] for c in [orchestrator, artifact_store]
-            }
+            components = []
+            for component in component_requests:
+                validate_name(component)
+                self._fail_if_component_with_name_type_exists(
+                    name=component.name,
+                    component_type=component.type,
+                    workspace_id=component.workspace,
+                    session=session,
+                )
+                components.append(
+                    StackComponentSchema(
+                        name=component.name,
+                        workspace_id=component.workspace,
+                        user_id=component.user,
+                        component_spec_path=component.component_spec_path,
+                        type=component.type,
+                        flavor=component.flavor,
+                        configuration=_encode_json_b64(
+                            component.configuration
+                        ),
+                        labels=_encode_json_b64(component.labels),
+                        connector_resource_id=component.connector_resource_id,
+                    )
+                )
 
             stack = InternalStackRequest(
                 # Passing `None` for the user here means the stack is owned by
                 # the server, which for RBAC indicates that everyone can read it
                 user=None,
                 name=DEFAULT_STACK_AND_COMPONENT_NAME,
-                components=components,
+                components={c.type: [c.id] for c in components},
                 workspace=workspace.id,
             )
-            return self.create_stack(stack=stack)
+            validate_name(stack)
+            self._fail_if_stack_with_name_exists(
+                stack_name=stack.name,
+                workspace_id=stack.workspace,
+                session=session,
+            )
+
+            new_stack_schema = StackSchema(
+                workspace_id=stack.workspace,
+                user_id=stack.user,
+                stack_spec_path=stack.stack_spec_path,
+                name=stack.name,
+                description=stack.description,
+                components=components,
+                labels=_encode_json_b64(stack.labels),
+            )
+            # The components share a table and have client-generated IDs, so
+            # they are inserted with a single multi-row statement
+            session.add_all([*components, new_stack_schema])
+            session.commit()
+            session.refresh(new_stack_schema)
+
+            return new_stack_schema.to_model(include_metadata=True)
 
     def _get_or_create_default_stack(
         self, workspace: WorkspaceResponse
@@ -7972,7 +8183,33 @@ class SqlZenStore(BaseZenStore):
             A list of all step runs matching the filter criteria.
         """
         with Session(self.engine) as session:
-            query = select(StepRunSchema)
+            # The input and output artifacts are part of every step run
+            # response, so we load them for all steps in the page at once
+            # instead of issuing separate queries per step
+            query = select(StepRunSchema).options(
+                selectinload(
+                    StepRunSchema.input_artifacts  # type: ignore[arg-type]
+                )
+                .selectinload(
+                    StepRunInputArtifactSchema.artifact_version  # type: ignore[arg-type]
+                )
+                .options(*_artifact_version_load_options()),
+                selectinload(
+                    StepRunSchema.output_artifacts  # type: ignore[arg-type]
+                )
+                .selectinload(
+                    StepRunOutputArtifactSchema.artifact_version  # type: ignore[arg-type]
+                )
+                .options(*_artifact_version_load_options()),
+                selectinload(StepRunSchema.run_metadata),  # type: ignore[arg-type]
+            )
+            if not hydrate:
+                # The docstring and source code are only included in the step
+                # run metadata
+                query = query.options(
+                    defer(StepRunSchema.docstring),  # type: ignore[arg-type]
+                    defer(StepRunSchema.source_code),  # type: ignore[arg-type]
+                )
             return self.filter_and_paginate(
                 session=session,
                 query=query,
@@ -8260,7 +8497,9 @@ class SqlZenStore(BaseZenStore):
 
         # Deployment always exists for pipeline runs of newer versions
         assert pipeline_run.deployment
-        num_steps = len(pipeline_run.deployment.to_model().step_configurations)
+        # Counting the steps doesn't require validating every step
+        # configuration, so we only parse the JSON here
+        num_steps = len(loads(pipeline_run.deployment.step_configurations))
         new_status = get_pipeline_run_status(
             step_statuses=[
                 ExecutionStatus(step_run.status) for step_run in step_runs
@@ -8892,25 +9131,53 @@ class SqlZenStore(BaseZenStore):
         Raises:
             KeyError: If the user does not exist.
         """
-        with Session(self.engine) as session:
-            if user_name_or_id is None:
-                # Get the active account, depending on the context
-                user = self._get_active_user(session=session)
-            else:
-                # If a UUID is passed, we also allow fetching service accounts
-                # with that ID.
-                service_account: Optional[bool] = False
-                if uuid_utils.is_valid_uuid(user_name_or_id):
-                    service_account = None
-                user = self._get_account_schema(
-                    user_name_or_id,
-                    session=session,
-                    service_account=service_account,
+
+        def _load_user() -> UserResponse:
+            with Session(self.engine) as session:
+                if user_name_or_id is None:
+                    # Get the active account, depending on the context
+                    user = self._get_active_user(session=session)
+                else:
+                    # If a UUID is passed, we also allow fetching service
+                    # accounts with that ID.
+                    service_account: Optional[bool] = False
+                    if uuid_utils.is_valid_uuid(user_name_or_id):
+                        service_account = None
+                    user = self._get_account_schema(
+                        user_name_or_id,
+                        session=session,
+                        service_account=service_account,
+                    )
+
+                return user.to_model(
+                    include_private=include_private, include_metadata=hydrate
                 )
 
-            return user.to_model(
-                include_private=include_private, include_metadata=hydrate
-            )
+        # The active account depends on the context and is therefore not
+        # cached. Lookups including private information are used to
+        # authenticate requests, which always need to see whether the account
+        # was deactivated or deleted in the meantime.
+        if (
+            user_name_or_id is None
+            or include_private
+            or self._user_cache is None
+        ):
+            return _load_user()
+
+        # The cached model is shared, so we return a copy which callers can
+        # modify (e.g. by hydrating it)
+        return self._user_cache.get_or_load(
+            (user_name_or_id, hydrate), _load_user
+        ).model_copy(deep=True)
+
+    def _invalidate_user_cache(self) -> None:
+        """Invalidate all cached user lookups.
+
+        Users are cached by both name and ID, so the whole cache is cleared
+        whenever an account is modified.
+        """
+        if self._user_cache is not None:
+            self._user_cache.clear()
 
     def get_auth_user(
         self, user_name_or_id: Union[str, UUID]
@@ -9034,6 +9301,7 @@ class SqlZenStore(BaseZenStore):
             existing_user.update_user(user_update=user_update)
             session.add(existing_user)
             session.commit()
+            self._invalidate_user_cache()
 
             # Refresh the Model that was just created
             session.refresh(existing_user)
@@ -9105,6 +9373,7 @@ class SqlZenStore(BaseZenStore):
 
             session.delete(user)
             session.commit()
+            self._invalidate_user_cache()
 
     def _create_default_user_on_db_init(self) -> bool:
         """Check if the default user should be created on database initialization.
@@ -9233,11 +9502,24 @@ class SqlZenStore(BaseZenStore):
         Returns:
             The requested workspace if one was found.
         """
-        with Session(self.engine) as session:
-            workspace = self._get_workspace_schema(
-                workspace_name_or_id, session=session
-            )
-        return workspace.to_model(include_metadata=hydrate)
+
+        def _load_workspace() -> WorkspaceResponse:
+            with Session(self.engine) as session:
+                workspace = self._get_workspace_schema(
+                    workspace_name_or_id, session=session
+                )
+                return workspace.to_model(include_metadata=hydrate)
+
+        if self._workspace_cache is None:
+            return _load_workspace()
+
+        # Most workspace scoped server endpoints identify the workspace by
+        # name, so we cache the workspaces to avoid resolving the same name
+        # for every request. The cached model is shared, so callers get a copy
+        # which they can hydrate or modify.
+        return self._workspace_cache.get_or_load(
+            (workspace_name_or_id, hydrate), _load_workspace
+        ).model_copy(deep=True)
 
     def list_workspaces(
         self,
@@ -9306,6 +9588,9 @@ class SqlZenStore(BaseZenStore):
             existing_workspace.update(workspace_update=workspace_update)
             session.add(existing_workspace)
             session.commit()
+            self._default_workspace = None
+            if self._workspace_cache is not None:
+                self._workspace_cache.clear()
 
             # Refresh the Model that was just created
             session.refresh(existing_workspace)
@@ -9332,6 +9617,8 @@ class SqlZenStore(BaseZenStore):
 
             session.delete(workspace)
             session.commit()
+            if self._workspace_cache is not None:
+                self._workspace_cache.clear()
 
     def _get_or_create_default_workspace(self) -> WorkspaceResponse:
         """Get or create the default workspace if it doesn't exist.
@@ -9342,7 +9629,7 @@ class SqlZenStore(BaseZenStore):
         default_workspace_name = self._default_workspace_name
 
         try:
-            return self.get_workspace(default_workspace_name)
+            return self._get_default_workspace()
         except KeyError:
             logger.info(
                 f"Creating default workspace '{default_workspace_name}' ..."
@@ -441,6 +441,70 @@ def test_deregistering_a_stack_component_that_is_part_of_a_registered_stack(
         )
 
 
+def test_created_and_deleted_flavors_are_visible_immediately(clean_client):
+    """Tests that flavor lookups never return outdated flavors."""
+    with pytest.raises(KeyError):
+        clean_client.get_flavor_by_name_and_type(
+            name="aria", component_type=StackComponentType.ORCHESTRATOR
+        )
+
+    flavor = clean_client.create_flavor(
+        source="tests.unit.test_flavor.AriaOrchestratorFlavor",
+        component_type=StackComponentType.ORCHESTRATOR,
+    )
+    for _ in range(2):
+        assert (
+            clean_client.get_flavor_by_name_and_type(
+                name="aria", component_type=StackComponentType.ORCHESTRATOR
+            ).id
+            == flavor.id
+        )
+
+    clean_client.delete_flavor(str(flavor.id))
+    with pytest.raises(KeyError):
+        clean_client.get_flavor_by_name_and_type(
+            name="aria", component_type=StackComponentType.ORCHESTRATOR
+        )
+
+
+def test_flavor_cache_is_scoped_to_store_and_workspace(clean_client, mocker):
+    """Tests that cached flavors are not shared between stores or workspaces."""
+    list_flavors = mocker.spy(clean_client, "list_flavors")
+
+    def _get_local_orchestrator_flavor():
+        return clean_client.get_flavor_by_name_and_type(
+            name="local", component_type=StackComponentType.ORCHESTRATOR
+        )
+
+    _get_local_orchestrator_flavor()
+    _get_local_orchestrator_flavor()
+    assert list_flavors.call_count == 1
+
+    original_workspace = clean_client.active_workspace
+    workspace = clean_client.create_workspace(
+        name=sample_name("flavor_workspace"), description=""
+    )
+    try:
+        clean_client.set_active_workspace(workspace.id)
+        _get_local_orchestrator_flavor()
+        assert list_flavors.call_count == 2
+    finally:
+        clean_client.set_active_workspace(original_workspace.id)
+        clean_client.delete_workspace(workspace.id)
+
+    _get_local_orchestrator_flavor()
+    assert list_flavors.call_count == 2
+
+    mocker.patch.object(
+        type(clean_client.zen_store),
+        "url",
+        new_callable=mocker.PropertyMock,
+        return_value="sqlite:///other_store.db",
+    )
+    _get_local_orchestrator_flavor()
+    assert list_flavors.call_count == 3
+
+
 def test_getting_a_pipeline(clean_client: "Client"):
     """Tests fetching of a pipeline."""
     # Non-existent ID
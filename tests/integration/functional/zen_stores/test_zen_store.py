@@ -11,6 +11,7 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+import json
 import os
 import random
 import time
@@ -26,6 +27,7 @@ from uuid import UUID, uuid4
 import pytest
 from pydantic import SecretStr
 from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
 
 from tests.integration.functional.utils import sample_name
 from tests.integration.functional.zen_stores.utils import (
@@ -41,6 +43,7 @@ from tests.integration.functional.zen_stores.utils import (
     ServiceConnectorTypeContext,
     StackContext,
     UserContext,
+    WorkspaceContext,
     list_of_entities,
 )
 from tests.unit.pipelines.test_build_utils import (
@@ -130,7 +133,14 @@ from zenml.models.v2.core.user import UserFilter
 from zenml.utils import code_repository_utils, source_utils
 from zenml.utils.enum_utils import StrEnum
 from zenml.zen_stores.rest_zen_store import RestZenStore
-from zenml.zen_stores.sql_zen_store import SqlZenStore
+from zenml.zen_stores.schemas import PipelineDeploymentSchema
+from zenml.zen_stores.schemas.step_run_schemas import (
+    _load_step_configurations,
+)
+from zenml.zen_stores.sql_zen_store import (
+    SqlZenStore,
+    SqlZenStoreConfiguration,
+)
 
 DEFAULT_NAME = "default"
 
@@ -378,6 +388,99 @@ def test_deleting_default_workspace_fails():
         client.zen_store.delete_workspace(DEFAULT_NAME)
 
 
+def test_workspace_updates_and_deletion_are_visible_immediately():
+    """Tests that workspace lookups never return outdated workspaces."""
+    zen_store = Client().zen_store
+
+    with WorkspaceContext() as workspace:
+        # Populate any caches with the original workspace
+        assert zen_store.get_workspace(workspace.name).id == workspace.id
+        assert zen_store.get_workspace(workspace.id).name == workspace.name
+
+        new_name = sample_name("renamed_workspace")
+        zen_store.update_workspace(
+            workspace.id,
+            WorkspaceUpdate(name=new_name, description="Renamed"),
+        )
+        with pytest.raises(KeyError):
+            zen_store.get_workspace(workspace.name)
+        assert zen_store.get_workspace(new_name).id == workspace.id
+        renamed_workspace = zen_store.get_workspace(workspace.id)
+        assert renamed_workspace.name == new_name
+        assert renamed_workspace.description == "Renamed"
+
+        zen_store.delete_workspace(workspace.id)
+        with pytest.raises(KeyError):
+            zen_store.get_workspace(new_name)
+        with pytest.raises(KeyError):
+            zen_store.get_workspace(workspace.id)
+
+
+def test_default_workspace_updates_are_visible_immediately():
+    """Tests that the default workspace is not outdated after updates."""
+    zen_store = Client().zen_store
+    default_workspace = zen_store._get_default_workspace()
+    original_description = default_workspace.description
+
+    try:
+        zen_store.update_workspace(
+            default_workspace.id,
+            WorkspaceUpdate(description="Updated default workspace"),
+        )
+        assert (
+            zen_store._get_default_workspace().description
+            == "Updated default workspace"
+        )
+        assert (
+            zen_store.get_workspace(DEFAULT_WORKSPACE_NAME).description
+            == "Updated default workspace"
+        )
+    finally:
+        zen_store.update_workspace(
+            default_workspace.id,
+            WorkspaceUpdate(description=original_description),
+        )
+    assert (
+        zen_store._get_default_workspace().description == original_description
+    )
+
+
+def test_initialization_repairs_partially_initialized_database(tmp_path):
+    """Tests that missing database defaults are created on initialization."""
+    # The default workspace exists, but the server was never activated and
+    # the default user is missing
+    store = SqlZenStore(
+        config=SqlZenStoreConfiguration(
+            url=f"sqlite:///{tmp_path / 'workspace_only.db'}"
+        ),
+        skip_default_registrations=True,
+    )
+    store._get_or_create_default_workspace()
+    assert store.get_server_settings().active is False
+    assert store.list_users(UserFilter()).total == 0
+
+    store._initialize_database()
+    assert store.get_server_settings().active is True
+    assert store.get_user(DEFAULT_USERNAME).name == DEFAULT_USERNAME
+
+    # The server is activated, but the default workspace is missing
+    store = SqlZenStore(
+        config=SqlZenStoreConfiguration(
+            url=f"sqlite:///{tmp_path / 'activated_only.db'}"
+        ),
+        skip_default_registrations=True,
+    )
+    store._auto_activate_server()
+    with pytest.raises(KeyError):
+        store.get_workspace(DEFAULT_WORKSPACE_NAME)
+
+    store._initialize_database()
+    assert (
+        store.get_workspace(DEFAULT_WORKSPACE_NAME).name
+        == DEFAULT_WORKSPACE_NAME
+    )
+
+
 #  .------.
 # | USERS |
 # '-------'
@@ -780,6 +883,34 @@ def test_get_user():
             assert user.is_service_account is False
 
 
+def test_user_updates_and_deletion_are_visible_immediately():
+    """Tests that user lookups never return outdated cached accounts."""
+    zen_store = Client().zen_store
+    if zen_store.type != StoreType.SQL:
+        pytest.skip("Accounts can only be deactivated directly in SQL stores.")
+
+    with UserContext(delete=False) as user_account:
+        # Populate any caches with the active account
+        assert zen_store.get_user(user_account.name).active is True
+        assert (
+            zen_store.get_user(user_account.id, include_private=True).active
+            is True
+        )
+
+        zen_store.update_user(user_account.id, UserUpdate(active=False))
+        assert zen_store.get_user(user_account.name).active is False
+        assert (
+            zen_store.get_user(user_account.id, include_private=True).active
+            is False
+        )
+
+        zen_store.delete_user(user_account.id)
+        with pytest.raises(KeyError):
+            zen_store.get_user(user_account.name)
+        with pytest.raises(KeyError):
+            zen_store.get_user(user_account.id, include_private=True)
+
+
 def test_delete_user_with_resources_fails():
     """Tests deleting a user with resources fails."""
     zen_store = Client().zen_store
@@ -2821,6 +2952,75 @@ def test_stacks_are_accessible_by_other_users():
 # | Pipelines |
 # '-----------'
 
+# .----------------------.
+# | Pipeline deployments |
+# '----------------------'
+
+
+def test_deployment_configurations_are_cached():
+    """Tests caching the configurations of deployments."""
+    client = Client()
+    store = client.zen_store
+    if not isinstance(store, SqlZenStore):
+        pytest.skip("Test only applies to SQL store")
+
+    step_name = sample_name("foo")
+    deployment = store.create_deployment(
+        PipelineDeploymentRequest(
+            user=client.active_user.id,
+            workspace=client.active_workspace.id,
+            run_name_template=sample_name("foo"),
+            pipeline_configuration=PipelineConfiguration(
+                name=sample_name("foo")
+            ),
+            stack=client.active_stack.id,
+            client_version="0.1.0",
+            server_version="0.1.0",
+            step_configurations={
+                step_name: Step(
+                    spec=StepSpec(
+                        source=Source(
+                            module="acme.foo",
+                            type=SourceType.INTERNAL,
+                        ),
+                        upstream_steps=[],
+                    ),
+                    config=StepConfiguration(name=step_name),
+                )
+            },
+        )
+    )
+    cache = store._deployment_configurations_cache
+
+    # Unhydrated deployments don't include the configurations
+    store.get_deployment(deployment.id, hydrate=False)
+    assert cache.get(deployment.id) is None
+
+    hydrated_deployment = store.get_deployment(deployment.id)
+    cached_configurations = cache.get(deployment.id)
+    assert cached_configurations is not None
+
+    # Deprecated attributes are removed by the validators of the step
+    # configuration, which must not modify the cached values
+    cached_configurations[1][step_name]["config"]["docstring"] = "docstring"
+    reloaded_deployment = store.get_deployment(deployment.id)
+    assert cache.get(deployment.id) is cached_configurations
+    assert "docstring" in cached_configurations[1][step_name]["config"]
+    assert (
+        reloaded_deployment.step_configurations
+        == hydrated_deployment.step_configurations
+    )
+    assert (
+        reloaded_deployment.pipeline_configuration
+        == hydrated_deployment.pipeline_configuration
+    )
+
+    store.delete_deployment(deployment.id)
+    assert cache.get(deployment.id) is None
+    with pytest.raises(KeyError):
+        store.get_deployment(deployment.id)
+
+
 # .----------------.
 # | Pipeline runs  |
 # '----------------'
@@ -2936,6 +3136,42 @@ def test_get_run_step_inputs_succeeds():
             assert len(run_step_inputs) == 1
 
 
+def test_get_run_step_does_not_modify_cached_step_configurations():
+    """Tests that converting steps doesn't modify cached configurations."""
+    client = Client()
+    store = client.zen_store
+    if not isinstance(store, SqlZenStore):
+        pytest.skip("Test only applies to SQL store")
+
+    with PipelineRunContext(1) as runs:
+        step = store.list_run_steps(
+            StepRunFilter(pipeline_run_id=runs[0].id, name="step_2")
+        ).items[0]
+
+        # Deprecated attributes are removed by the validators of the step
+        # configuration
+        with Session(store.engine) as session:
+            deployment = session.exec(
+                select(PipelineDeploymentSchema).where(
+                    PipelineDeploymentSchema.id == runs[0].deployment_id
+                )
+            ).one()
+            step_configurations = json.loads(deployment.step_configurations)
+            step_configurations[step.name]["config"]["docstring"] = "doc"
+            deployment.step_configurations = json.dumps(step_configurations)
+            session.add(deployment)
+            session.commit()
+            session.refresh(deployment)
+            step_configurations_json = deployment.step_configurations
+
+        for _ in range(2):
+            store.get_run_step(step.id)
+            cached_configurations = _load_step_configurations(
+                step_configurations_json
+            )
+            assert "docstring" in cached_configurations[step.name]["config"]
+
+
 # .-----------.
 # | Artifacts |
 # '-----------'
@@ -0,0 +1,205 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import gc
+import os
+import queue
+import time
+import weakref
+
+import pytest
+
+from zenml.analytics import source_context
+from zenml.analytics.client import Client, default_client
+from zenml.enums import SourceContextTypes
+
+
+@pytest.fixture
+def mock_post(mocker):
+    """Mocks the function that sends messages to the analytics server."""
+    return mocker.patch("zenml.analytics.client.post")
+
+
+def _sent_batches(mock_post):
+    return [call.kwargs["batch"] for call in mock_post.call_args_list]
+
+
+def test_messages_are_not_queued_if_sending_is_disabled(mock_post):
+    """Tests that nothing is queued or sent if sending is disabled."""
+    client = Client(send=False)
+
+    assert client._enqueue("message") == (True, "message")
+
+    client.flush()
+    assert client._consumer is None
+    assert client._queue.empty()
+    mock_post.assert_not_called()
+
+
+def test_messages_are_sent_in_batches(mock_post):
+    """Tests that messages are sent in batches of at most the batch size."""
+    client = Client(max_batch_size=2, upload_interval=5)
+
+    for message in ["a", "b", "c"]:
+        client._enqueue(message)
+    client.flush()
+
+    assert _sent_batches(mock_post) == [["a", "b"], ["c"]]
+
+
+def test_incomplete_batch_is_sent_after_upload_interval(mock_post):
+    """Tests that incomplete batches are sent without waiting for a flush."""
+    client = Client(max_batch_size=50, upload_interval=0.01)
+
+    client._enqueue("a")
+
+    deadline = time.monotonic() + 5
+    while not mock_post.called and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert _sent_batches(mock_post) == [["a"]]
+
+    client.flush()
+
+
+def test_messages_are_sent_per_source_context(mock_post):
+    """Tests that messages are grouped by their source context."""
+    client = Client(upload_interval=5)
+
+    client._enqueue("python_message")
+    token = source_context.set(SourceContextTypes.CLI)
+    try:
+        client._enqueue("cli_message")
+    finally:
+        source_context.reset(token)
+    client.flush()
+
+    sent = {
+        call.kwargs["source"]: call.kwargs["batch"]
+        for call in mock_post.call_args_list
+    }
+    assert sent == {
+        SourceContextTypes.PYTHON: ["python_message"],
+        SourceContextTypes.CLI: ["cli_message"],
+    }
+
+
+def test_failed_requests_do_not_stop_the_consumer(mock_post):
+    """Tests that the consumer keeps sending messages if a request fails."""
+    mock_post.side_effect = [RuntimeError("offline"), None]
+    client = Client(max_batch_size=1, upload_interval=5)
+
+    client._enqueue("a")
+    client._enqueue("b")
+    client.flush()
+
+    assert _sent_batches(mock_post) == [["a"], ["b"]]
+
+
+def test_oldest_message_is_dropped_if_queue_is_full(mocker, mock_post):
+    """Tests that the oldest queued message is dropped to make room."""
+    client = Client(max_queue_size=2)
+    # Prevent the consumer from draining the queue
+    mocker.patch.object(client, "_ensure_consumer")
+
+    for message in ["a", "b", "c"]:
+        assert client._enqueue(message) == (True, message)
+
+    queued = []
+    while True:
+        try:
+            queued.append(client._queue.get_nowait())
+        except queue.Empty:
+            break
+    assert [message for message, _ in queued] == ["b", "c"]
+
+
+def test_flush_stops_the_consumer_until_the_next_message(mock_post):
+    """Tests that the consumer is stopped by a flush and restarted later."""
+    client = Client(upload_interval=5)
+
+    client._enqueue("a")
+    consumer = client._consumer
+    client.flush()
+    assert not consumer.is_alive()
+    assert _sent_batches(mock_post) == [["a"]]
+
+    client._enqueue("b")
+    assert client._consumer is not consumer
+    client.flush()
+    assert _sent_batches(mock_post) == [["a"], ["b"]]
+
+
+def test_flush_without_consumer_returns_immediately(mock_post):
+    """Tests that flushing a client that never sent anything is a no-op."""
+    client = Client()
+
+    client.flush()
+
+    assert client._consumer is None
+    mock_post.assert_not_called()
+
+
+def test_clients_do_not_register_process_hooks(mocker):
+    """Tests that clients other than the default one can be collected."""
+    mock_atexit_register = mocker.patch(
+        "zenml.analytics.client.atexit.register"
+    )
+    mock_register_at_fork = mocker.patch(
+        "zenml.analytics.client.os.register_at_fork", create=True
+    )
+    client = Client()
+    mock_atexit_register.assert_not_called()
+    mock_register_at_fork.assert_not_called()
+
+    client_ref = weakref.ref(client)
+    del client
+    gc.collect()
+    assert client_ref() is None
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires os.fork.")
+def test_default_client_is_reset_in_forked_child_processes(mocker):
+    """Tests that forked processes start with an empty default queue."""
+    mocker.patch.object(default_client, "_ensure_consumer")
+    mocker.patch.object(default_client, "send", True)
+    default_client._enqueue("parent_message")
+
+    try:
+        pid = os.fork()
+        if pid == 0:
+            os._exit(0 if default_client._queue.empty() else 1)
+
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+    finally:
+        assert default_client._queue.get_nowait()[0] == "parent_message"
+
+
+def test_state_is_reset_in_forked_child_processes(mocker, mock_post):
+    """Tests that forked processes don't inherit the queue or locks."""
+    client = Client()
+
+    # Simulate the state a child process inherits from its parent: queued
+    # messages, a consumer thread that doesn't exist in the child and a lock
+    # that was held by another thread while forking
+    mocker.patch.object(client, "_ensure_consumer")
+    client._enqueue("parent_message")
+    client._consumer = mocker.Mock()
+    client._consumer_lock.acquire()
+
+    client._reset()
+
+    assert client._queue.empty()
+    assert client._consumer is None
+    assert not client._consumer_lock.locked()
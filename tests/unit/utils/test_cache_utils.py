@@ -0,0 +1,123 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import threading
+import time
+
+import pytest
+
+from zenml.utils.cache_utils import TTLCache
+
+
+def test_ttl_cache_get_and_set():
+    """Tests that cached values are returned until they are removed."""
+    cache = TTLCache(ttl=60)
+    assert cache.get("key") is None
+
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+
+    cache.pop("key")
+    assert cache.get("key") is None
+
+    cache.set("key", "value")
+    cache.clear()
+    assert cache.get("key") is None
+
+
+def test_ttl_cache_entries_expire(mocker):
+    """Tests that cache entries expire after the time-to-live."""
+    mock_time = mocker.patch("zenml.utils.cache_utils.time.monotonic")
+    mock_time.return_value = 100.0
+
+    cache = TTLCache(ttl=10)
+    cache.set("key", "value")
+
+    mock_time.return_value = 109.0
+    assert cache.get("key") == "value"
+
+    mock_time.return_value = 110.0
+    assert cache.get("key") is None
+
+
+def test_ttl_cache_evicts_least_recently_used_entry():
+    """Tests that the least recently used entry is evicted when full."""
+    cache = TTLCache(ttl=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # Access `a` so that `b` becomes the least recently used entry
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_get_or_load_loads_missing_values_once():
+    """Tests that concurrent loads of a missing value call the loader once."""
+    cache = TTLCache(ttl=60)
+    calls = []
+
+    def _loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return "value"
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(cache.get_or_load("key", _loader))
+        )
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == ["value"] * 5
+    assert cache.get("key") == "value"
+
+
+def test_ttl_cache_get_or_load_does_not_cache_errors():
+    """Tests that values are not cached if the loader fails."""
+    cache = TTLCache(ttl=60)
+
+    def _loader():
+        raise KeyError("missing")
+
+    with pytest.raises(KeyError):
+        cache.get_or_load("key", _loader)
+
+    assert cache.get("key") is None
+    assert cache.get_or_load("key", lambda: "value") == "value"
+
+
+def test_ttl_cache_get_or_load_does_not_cache_outdated_values():
+    """Tests that values loaded before a removal are not cached."""
+    cache = TTLCache(ttl=60)
+
+    def _loader():
+        # Simulates an update that invalidates the cache while the old value
+        # is still being loaded
+        cache.clear()
+        return "old_value"
+
+    assert cache.get_or_load("key", _loader) == "old_value"
+    assert cache.get("key") is None
+    assert cache.get_or_load("key", lambda: "new_value") == "new_value"
+    assert cache.get("key") == "new_value"
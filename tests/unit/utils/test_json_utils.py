@@ -0,0 +1,67 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import json
+
+from zenml.utils import json_utils
+
+
+def test_dumps_bytes_returns_json_bytes():
+    """Tests that `dumps_bytes` returns valid UTF-8 encoded JSON."""
+    value = {"path": "/tmp/store", "nested": {"a": [1, 2.5, None, True]}}
+
+    result = json_utils.dumps_bytes(value)
+
+    assert isinstance(result, bytes)
+    assert json.loads(result.decode("utf-8")) == value
+
+
+def test_dumps_bytes_sorts_keys():
+    """Tests that `dumps_bytes` sorts dictionary keys if requested."""
+    result = json_utils.dumps_bytes({"b": 1, "a": 2}, sort_keys=True)
+
+    assert list(json.loads(result)) == ["a", "b"]
+
+
+def test_dumps_bytes_falls_back_without_orjson(mocker):
+    """Tests that `dumps_bytes` works if `orjson` is not installed."""
+    mocker.patch.object(json_utils, "orjson", None)
+
+    assert json_utils.dumps_bytes({}) == b"{}"
+    assert json_utils.dumps_bytes(None) == b"null"
+
+
+def test_loads_parses_json():
+    """Tests that `loads` parses JSON strings and bytes."""
+    value = {"a": [1, 2.5, None, True], "b": {"c": "d"}}
+
+    assert json_utils.loads(json.dumps(value)) == value
+    assert json_utils.loads(json.dumps(value).encode("utf-8")) == value
+
+
+def test_loads_falls_back_for_non_standard_json():
+    """Tests that `loads` accepts documents only the stdlib can parse."""
+    result = json_utils.loads('{"a": NaN, "b": 1}')
+
+    assert result["a"] != result["a"]
+    assert result["b"] == 1
+
+
+def test_dumps_bytes_keeps_non_finite_floats():
+    """Tests that `dumps_bytes` doesn't replace NaN or infinity by null."""
+    value = {"a": float("nan"), "b": [float("inf"), -float("inf")], "c": 1.5}
+
+    result = json_utils.dumps_bytes(value)
+
+    assert result == json.dumps(value).encode("utf-8")
+    assert b"null" not in result
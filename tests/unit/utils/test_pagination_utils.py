@@ -0,0 +1,57 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from zenml.utils.pagination_utils import depaginate, iterate_pages
+
+
+class _FakePage:
+    def __init__(self, index, total_pages, items):
+        self.index = index
+        self.total_pages = total_pages
+        self.items = items
+
+
+def _make_list_method(pages):
+    requested_pages = []
+
+    def _list_method(page=1, **kwargs):
+        requested_pages.append(page)
+        return _FakePage(
+            index=page, total_pages=len(pages), items=pages[page - 1]
+        )
+
+    return _list_method, requested_pages
+
+
+def test_depaginate_returns_items_of_all_pages():
+    """Tests that depaginating returns the items of all pages."""
+    list_method, requested_pages = _make_list_method([[1, 2], [3, 4], [5]])
+
+    assert depaginate(list_method) == [1, 2, 3, 4, 5]
+    assert requested_pages == [1, 2, 3]
+
+
+def test_iterate_pages_fetches_pages_lazily():
+    """Tests that pages are only fetched once their items are needed."""
+    list_method, requested_pages = _make_list_method([[1, 2], [3, 4], [5]])
+
+    items = iterate_pages(list_method)
+    assert requested_pages == []
+
+    assert next(items) == 1
+    assert next(items) == 2
+    assert requested_pages == [1]
+
+    assert 3 in items
+    assert requested_pages == [1, 2]
@@ -0,0 +1,179 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from datetime import datetime
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from zenml.enums import ExecutionStatus
+from zenml.exceptions import IllegalOperationError
+from zenml.lineage_graph.lineage_graph import LineageGraph
+from zenml.zen_server.rbac.models import Resource, ResourceType
+from zenml.zen_server.routers import runs_endpoints
+
+
+@pytest.fixture
+def run_dag_env(mocker):
+    """Fixture to call the run DAG endpoint without a server."""
+    runs_endpoints._run_dag_cache.clear()
+
+    run_id = uuid4()
+    run_resource = Resource(type=ResourceType.PIPELINE_RUN, id=run_id)
+    step = MagicMock()
+    step.status = ExecutionStatus.COMPLETED
+    run = MagicMock()
+    run.id = run_id
+    run.updated = datetime(2024, 1, 1)
+    run.status = ExecutionStatus.COMPLETED
+    run.steps = {"step": step}
+
+    store = MagicMock()
+    store.get_run.return_value = run
+    permissions = {"read": True}
+
+    def _check_permissions(user, resources, action):
+        return {resource: permissions["read"] for resource in resources}
+
+    rbac = MagicMock()
+    rbac.check_permissions.side_effect = _check_permissions
+
+    def _verify_permission(model, action):
+        if not permissions["read"]:
+            raise IllegalOperationError("Insufficient permissions.")
+
+    mocker.patch.object(runs_endpoints, "zen_store", return_value=store)
+    mocker.patch.object(runs_endpoints, "rbac", return_value=rbac)
+    mocker.patch.object(
+        runs_endpoints,
+        "server_config",
+        return_value=MagicMock(rbac_enabled=True),
+    )
+    mocker.patch.object(
+        runs_endpoints,
+        "verify_permission_for_model",
+        side_effect=_verify_permission,
+    )
+    mocker.patch.object(
+        runs_endpoints,
+        "dehydrate_response_model",
+        side_effect=lambda model, permissions=None: model,
+    )
+    mocker.patch.object(
+        runs_endpoints, "get_subresources_for_model", return_value=set()
+    )
+    mocker.patch.object(
+        runs_endpoints, "get_resource_for_model", return_value=run_resource
+    )
+    mocker.patch.object(LineageGraph, "generate_run_nodes_and_edges")
+
+    yield run, store, rbac, permissions
+
+    runs_endpoints._run_dag_cache.clear()
+
+
+def _get_run_dag(run_id):
+    """Calls the run DAG endpoint."""
+    return runs_endpoints.get_run_dag(run_id=run_id, auth_context=MagicMock())
+
+
+def test_get_run_dag_uses_single_rbac_request_per_call(run_dag_env):
+    """Tests that the run DAG endpoint batches its permission checks."""
+    run, store, rbac, _ = run_dag_env
+
+    graph = _get_run_dag(run.id)
+    store.get_run.assert_called_once_with(run.id, hydrate=True)
+    assert rbac.check_permissions.call_count == 1
+
+    assert _get_run_dag(run.id) is graph
+    store.get_run.assert_called_with(run.id, hydrate=False)
+    assert store.get_run.call_count == 2
+    assert rbac.check_permissions.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "run_status, step_status",
+    [
+        (ExecutionStatus.RUNNING, ExecutionStatus.RUNNING),
+        (ExecutionStatus.FAILED, ExecutionStatus.RUNNING),
+    ],
+)
+def test_get_run_dag_does_not_cache_unfinished_runs(
+    run_dag_env, run_status, step_status
+):
+    """Tests that the DAG of runs that are still running is not cached."""
+    run, store, _, _ = run_dag_env
+    run.status = run_status
+    run.steps["step"].status = step_status
+
+    assert _get_run_dag(run.id) is not _get_run_dag(run.id)
+    assert store.get_run.call_count == 2
+    assert runs_endpoints._run_dag_cache.get(run.id) is None
+
+
+def test_get_run_dag_checks_permissions_of_cached_graphs(run_dag_env):
+    """Tests that cached DAGs are not returned after permission revocation."""
+    run, _, _, permissions = run_dag_env
+    _get_run_dag(run.id)
+    assert runs_endpoints._run_dag_cache.get(run.id) is not None
+
+    permissions["read"] = False
+    with pytest.raises(HTTPException) as e:
+        _get_run_dag(run.id)
+    assert e.value.status_code == 403
+
+
+def test_get_run_dag_does_not_cache_partially_readable_runs(run_dag_env):
+    """Tests that DAGs with hidden resources are not cached."""
+    run, _, rbac, _ = run_dag_env
+    rbac.check_permissions.side_effect = lambda user, resources, action: {
+        resource: False for resource in resources
+    }
+
+    _get_run_dag(run.id)
+    assert runs_endpoints._run_dag_cache.get(run.id) is None
+
+
+def test_get_run_dag_ignores_cached_graphs_of_updated_runs(run_dag_env):
+    """Tests that cached DAGs are only used if the run didn't change."""
+    run, store, _, _ = run_dag_env
+    graph = _get_run_dag(run.id)
+
+    run.updated = datetime(2024, 1, 2)
+    assert _get_run_dag(run.id) is not graph
+    store.get_run.assert_called_with(run.id, hydrate=True)
+
+
+def test_get_run_dag_fails_for_runs_deleted_elsewhere(run_dag_env):
+    """Tests that cached DAGs of runs deleted by other workers are unused."""
+    run, store, _, _ = run_dag_env
+    _get_run_dag(run.id)
+
+    store.get_run.side_effect = KeyError("Run not found.")
+    with pytest.raises(HTTPException) as e:
+        _get_run_dag(run.id)
+    assert e.value.status_code == 404
+
+
+def test_delete_run_evicts_cached_graph(run_dag_env, mocker):
+    """Tests that deleting a run evicts its cached DAG."""
+    run, _, _, _ = run_dag_env
+    mocker.patch.object(runs_endpoints, "verify_permissions_and_delete_entity")
+    _get_run_dag(run.id)
+    assert runs_endpoints._run_dag_cache.get(run.id) is not None
+
+    runs_endpoints.delete_run(run_id=run.id, _=MagicMock())
+    assert runs_endpoints._run_dag_cache.get(run.id) is None